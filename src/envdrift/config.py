@@ -713,11 +713,13 @@ def find_config(start_dir: Path | None = None, filename: str = "envdrift.toml")
     return None
 
 
-def load_config(path: Path | str | None = None) -> EnvdriftConfig:
+def load_config(path: Path | str | None = None, *, start_dir: Path | None = None) -> EnvdriftConfig:
     """Load configuration from envdrift.toml or pyproject.toml.
 
     Args:
         path: Path to config file (auto-detected if None)
+        start_dir: Directory auto-detection starts from when ``path`` is None
+            (defaults to the current working directory)
 
     Returns:
         EnvdriftConfig instance
@@ -737,7 +739,7 @@ def load_config(path: Path | str | None = None) -> EnvdriftConfig:
             # open() and raise an uncaught IsADirectoryError traceback (#443 #30).
             raise ConfigNotFoundError(f"Configuration path is not a file: {path}")
     else:
-        path = find_config()
+        path = find_config(start_dir)
         if path is None:
             # Return default config if no file found
             return EnvdriftConfig()
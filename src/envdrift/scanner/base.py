@@ -83,7 +83,7 @@ class FindingSeverity(Enum):
         return not self < other
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScanFinding:
     """A single secret or policy violation finding.
 
@@ -619,7 +619,9 @@ class ScanEngine:
         filtered_findings = self._ignore_filter.filter(filtered_findings)
 
         # Deduplicate findings (after filtering for deterministic, correct results)
-        unique_findings = self._deduplicate(filtered_findings)
+        unique_findings = self._deduplicate(
+            filtered_findings, skip_duplicate=self.config.skip_duplicate
+        )
 
         total_duration = int((time.time() - start_time) * 1000)
 
@@ -631,7 +633,10 @@ class ScanEngine:
             total_duration_ms=total_duration,
         )
 
-    def _deduplicate(self, findings: list[ScanFinding]) -> list[ScanFinding]:
+    @classmethod
+    def _deduplicate(
+        cls, findings: list[ScanFinding], *, skip_duplicate: bool
+    ) -> list[ScanFinding]:
         """Remove duplicate findings, keeping the highest severity.
 
         By default, duplicates are identified by file path, line number, rule ID,
@@ -655,20 +660,22 @@ class ScanEngine:
 
         Args:
             findings: List of all findings from all scanners.
+            skip_duplicate: The ``[guard] skip_duplicate`` setting; passed in
+                rather than read from an engine so dedup needs no instance.
 
         Returns:
             Deduplicated list sorted by severity (highest first).
         """
         seen: dict[tuple, ScanFinding] = {}
         for finding in findings:
-            key = self._dedup_key(finding)
+            key = cls._dedup_key(finding, skip_duplicate=skip_duplicate)
             existing = seen.get(key)
-            if existing is None or self._should_replace(finding, existing):
+            if existing is None or cls._should_replace(finding, existing):
                 seen[key] = finding
 
         survivors = list(seen.values())
-        if not self.config.skip_duplicate:
-            survivors = self._drop_hashless_duplicates(survivors)
+        if not skip_duplicate:
+            survivors = cls._drop_hashless_duplicates(survivors)
 
         # Sort by severity (highest first), then by file path
         return sorted(
@@ -677,8 +684,9 @@ class ScanEngine:
             reverse=True,
         )
 
-    def _dedup_key(self, finding: ScanFinding) -> tuple:
-        """Build the dedup key for ``finding`` under the active config.
+    @staticmethod
+    def _dedup_key(finding: ScanFinding, *, skip_duplicate: bool) -> tuple:
+        """Build the dedup key for ``finding`` under the given dedup mode.
 
         ``skip_duplicate``: key on the secret value only -- the secret hash when
         present (accurate), else the preview (may collide), else the location for
@@ -693,7 +701,7 @@ class ScanEngine:
         rule IDs and is *not* collapsed here. Policy findings carry no secret_hash
         and keep the historical location-only key.
         """
-        if self.config.skip_duplicate:
+        if skip_duplicate:
             if finding.secret_hash:
                 return (finding.secret_hash,)
             if finding.secret_preview:
@@ -38,7 +38,7 @@ from envdrift.scanner.platform_utils import get_platform_info, get_venv_bin_dir
 from envdrift.utils.git import get_git_root, has_git_head
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 
 def _load_constants() -> dict:
@@ -640,7 +640,7 @@ class TalismanScanner(ScannerBackend):
 
     def _parse_failure(
         self,
-        failure: dict[str, Any],
+        failure: Mapping[str, Any],
         file_path: Path,
         is_warning: bool = False,
     ) -> ScanFinding | None:
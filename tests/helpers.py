@@ -13,6 +13,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 
 _REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
 _FLOOR_RE = re.compile(r">=\s*([0-9]+(?:\.[0-9]+)*)")
+_ANSI_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
 
 
 def _canonical_name(name: str) -> str:
@@ -41,6 +42,11 @@ def declared_dependency_floor(package: str) -> str:
     raise AssertionError(f"{package!r} not found in [project] dependencies of pyproject.toml")
 
 
+def strip_ansi(text: str) -> str:
+    """Remove ANSI color (SGR) escape sequences from captured CLI output."""
+    return _ANSI_SGR_RE.sub("", text)
+
+
 def version_tuple(version: str) -> tuple[int, ...]:
     """Parse a release version string like ``0.13`` into an int tuple."""
     return tuple(int(part) for part in version.split("."))
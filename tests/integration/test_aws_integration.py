@@ -37,6 +37,13 @@ pytestmark = [
     ),
 ]
 
+# LocalStack answers in milliseconds and ``aws_test_env`` disables SDK retries,
+# so a CLI call that runs longer than this is hung, not slow. Multi-mapping
+# ``--all`` / ``--check-decryption`` runs also shell out to dotenvx per mapping.
+# stdin is always DEVNULL so a stray prompt fails immediately instead of hanging.
+CLI_TIMEOUT = 15
+CLI_SLOW_TIMEOUT = 30
+
 
 # --- Fixtures for AWS Tests ---
 
@@ -230,9 +237,10 @@ DATABASE_URL="encrypted:abc123..."
             [*envdrift_cmd, "pull"],
             cwd=env_project,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=CLI_TIMEOUT,
         )
 
         # Check command succeeded
@@ -297,9 +305,10 @@ environment = "production"
             [*envdrift_cmd, "pull"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=CLI_TIMEOUT,
         )
 
         assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
@@ -372,9 +381,10 @@ environment = "staging"
                 [*envdrift_cmd, "vault-push", "--all", "--skip-encrypt"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
@@ -420,9 +430,10 @@ environment = "staging"
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
@@ -478,9 +489,10 @@ environment = "production"
             [*envdrift_cmd, "pull"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=CLI_TIMEOUT,
         )
 
         # The command should either:
@@ -623,9 +635,10 @@ def _make_encrypted_project(folder: Path, environment: str) -> str:
     result = subprocess.run(
         [dotenvx, "encrypt", "-f", str(env_file)],
         cwd=str(folder),
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
-        timeout=30,
+        timeout=CLI_TIMEOUT,
     )
     assert result.returncode == 0, f"dotenvx encrypt failed: {result.stderr}"
 
@@ -678,9 +691,10 @@ class TestAWSVaultPushPullCLIRealBackend:
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
@@ -740,9 +754,10 @@ environment = "staging"
                 [*envdrift_cmd, "vault-push", "--all", "--skip-encrypt"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert first.returncode == 0, f"stdout: {first.stdout}\nstderr: {first.stderr}"
             first_out = (first.stdout + first.stderr).lower()
@@ -757,9 +772,10 @@ environment = "staging"
                 [*envdrift_cmd, "vault-push", "--all", "--skip-encrypt", "--force"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert second.returncode == 0, f"stdout: {second.stdout}\nstderr: {second.stderr}"
             assert "pushed" in (second.stdout + second.stderr).lower(), second.stdout
@@ -805,9 +821,10 @@ environment = "staging"
                 [*envdrift_cmd, "vault-push", "--all", "--skip-encrypt"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             out = (result.stdout + result.stderr).lower()
             assert "is a directory" not in out, out
@@ -867,9 +884,10 @@ environment = "staging"
                 [*envdrift_cmd, "vault-push", "--all"],  # NO --skip-encrypt, NO --force
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=90,
+                timeout=CLI_SLOW_TIMEOUT,
             )
             out = (result.stdout + result.stderr).lower()
             assert result.returncode == 0, out
@@ -944,9 +962,10 @@ environment = "staging"
                 [*envdrift_cmd, "pull", "--config", "envdrift.toml"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=90,
+                timeout=CLI_SLOW_TIMEOUT,
             )
             out = result.stdout + result.stderr
             assert result.returncode == 0, out
@@ -1000,9 +1019,10 @@ environment = "staging"
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
 
@@ -1061,9 +1081,10 @@ environment = "production"
                 [*envdrift_cmd, "sync"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert first.returncode == 0, f"stdout: {first.stdout}\nstderr: {first.stderr}"
             keys_path = work_dir / ".env.keys"
@@ -1075,9 +1096,10 @@ environment = "production"
                 [*envdrift_cmd, "sync"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert second.returncode == 0, f"stdout: {second.stdout}\nstderr: {second.stderr}"
             second_out = (second.stdout + second.stderr).lower()
@@ -1123,9 +1145,10 @@ environment = "production"
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 1, (
@@ -1193,9 +1216,10 @@ environment = "production"
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
 
@@ -1267,9 +1291,10 @@ environment = "production"
                 [*envdrift_cmd, "sync", "--check-decryption"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=CLI_SLOW_TIMEOUT,
             )
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
 
@@ -1546,9 +1571,10 @@ class TestAWSKeyMaterialNormalization:
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 0, f"stdout: {result.stdout}\nstderr: {result.stderr}"
@@ -1599,9 +1625,10 @@ class TestAWSKeyMaterialNormalization:
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 1, (
@@ -1651,9 +1678,10 @@ class TestAWSKeyMaterialNormalization:
                 ],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=60,
+                timeout=CLI_TIMEOUT,
             )
 
             assert result.returncode == 1, (
@@ -1722,9 +1750,10 @@ class TestAWSNotFoundNamesRegion:
             ],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=60,
+            timeout=CLI_TIMEOUT,
         )
 
         combined = " ".join((result.stdout + result.stderr).split())
@@ -1773,9 +1802,10 @@ class TestAWSEphemeralRendering:
                 [*envdrift_cmd, "pull", "--force", "--config", "envdrift.toml"],
                 cwd=work_dir,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
-                timeout=90,
+                timeout=CLI_SLOW_TIMEOUT,
             )
             combined = " ".join((result.stdout + result.stderr).split())
             assert result.returncode == 0, combined
@@ -24,6 +24,22 @@ import pytest
 # Mark all tests in this module
 pytestmark = [pytest.mark.integration]
 
+# Every case here is local file work, so a hung CLI (e.g. blocked on a prompt)
+# should fail in seconds rather than sit out a generous network-style timeout.
+# stdin is always DEVNULL so nothing can wait on the terminal.
+CLI_TIMEOUT = 10
+# The 1000-variable file is the one case whose run time scales with input, and
+# a cold interpreter start on a loaded Windows/macOS runner adds to it.
+LARGE_FILE_CLI_TIMEOUT = 60
+
+
+@pytest.fixture(scope="session")
+def large_env_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the 1000-variable .env payload once; tests copy it into their work_dir."""
+    path = tmp_path_factory.mktemp("large-env") / ".env"
+    path.write_text("".join(f"VAR_{i}=value_{i}_with_some_content\n" for i in range(1000)))
+    return path
+
 
 class TestEncryptEmptyFile:
     """Test encryption handling of empty files."""
@@ -46,9 +62,10 @@ class TestEncryptEmptyFile:
             [*envdrift_cmd, "encrypt", str(env_file)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should not crash - may succeed or report nothing to encrypt
@@ -86,9 +103,10 @@ class TestEncryptUnicodeValues:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle unicode gracefully
@@ -128,9 +146,10 @@ class TestEncryptMultilineValues:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle multiline gracefully
@@ -167,9 +186,10 @@ class TestEncryptSpecialCharsKeys:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle special chars gracefully
@@ -204,9 +224,10 @@ class TestEncryptAlreadyEncrypted:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should detect as already encrypted or handle gracefully
@@ -241,9 +262,10 @@ class TestEncryptMixedState:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should report mixed state or handle gracefully
@@ -283,12 +305,13 @@ class TestDecryptMissingKey:
         env.pop("DOTENV_PRIVATE_KEY_PRODUCTION", None)
 
         result = subprocess.run(
-            [*envdrift_cmd, "decrypt", str(env_file)],
+            [*envdrift_cmd, "decrypt", str(env_file), "--ci"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail gracefully with clear error
@@ -325,12 +348,13 @@ class TestDecryptWrongKey:
         env["PYTHONPATH"] = integration_pythonpath
 
         result = subprocess.run(
-            [*envdrift_cmd, "decrypt", str(env_file)],
+            [*envdrift_cmd, "decrypt", str(env_file), "--ci"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail gracefully - decryption with wrong key should error
@@ -346,14 +370,13 @@ class TestEncryptLargeFile:
     def test_encrypt_large_file(
         self,
         work_dir: Path,
+        large_env_file: Path,
         integration_pythonpath: str,
         envdrift_cmd: list[str],
     ):
         """Test encryption handling of files with many variables (1000+)."""
-        # Create large .env file with 1000+ variables
         env_file = work_dir / ".env"
-        lines = [f"VAR_{i}=value_{i}_with_some_content" for i in range(1000)]
-        env_file.write_text("\n".join(lines) + "\n")
+        shutil.copy(large_env_file, env_file)
 
         env = os.environ.copy()
         env["PYTHONPATH"] = integration_pythonpath
@@ -362,9 +385,10 @@ class TestEncryptLargeFile:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=60,  # Allow more time for large file
+            timeout=LARGE_FILE_CLI_TIMEOUT,  # Allow more time for large file
         )
 
         # Should handle large file without crashing or timing out
@@ -404,9 +428,10 @@ class TestDuplicatePublicKeys:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle duplicate keys gracefully
@@ -437,12 +462,13 @@ class TestDuplicatePublicKeys:
         env["PYTHONPATH"] = integration_pythonpath
 
         result = subprocess.run(
-            [*envdrift_cmd, "decrypt", str(env_file)],
+            [*envdrift_cmd, "decrypt", str(env_file), "--ci"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle duplicate keys gracefully (use first or dedupe)
@@ -473,9 +499,10 @@ class TestDuplicatePublicKeys:
             [*envdrift_cmd, "encrypt", str(env_file), "--check"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle conflicting keys gracefully
@@ -528,9 +555,10 @@ combined_file = ".env.production"
             [*envdrift_cmd, "push", "--env", "production"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle push command gracefully
@@ -573,9 +601,10 @@ combined_file = ".env.staging"
             [*envdrift_cmd, "pull-partial", "--env", "staging"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle pull-partial gracefully
@@ -604,9 +633,10 @@ encryption_backend = "dotenvx"
             [*envdrift_cmd, "push"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail gracefully with clear error about partial encryption not enabled
@@ -647,9 +677,10 @@ combined_file = ".env.dev"
             [*envdrift_cmd, "push", "--env", "dev"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle missing file gracefully
@@ -692,9 +723,10 @@ combined_file = ".env.test"
             [*envdrift_cmd, "push", "--env", "test"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         assert push_result.returncode in (0, 1), f"Push failed: {push_result.stderr}"
@@ -704,9 +736,10 @@ combined_file = ".env.test"
             [*envdrift_cmd, "pull-partial", "--env", "test"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         assert pull_result.returncode in (0, 1), f"Pull-partial failed: {pull_result.stderr}"
@@ -735,9 +768,10 @@ class TestDiffCommand:
             [*envdrift_cmd, "diff", str(env1), str(env2)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         assert result.returncode == 0, f"Diff failed: {result.stderr}"
@@ -762,9 +796,10 @@ class TestDiffCommand:
             [*envdrift_cmd, "diff", str(env1), str(env2)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         assert result.returncode in (0, 1), f"Diff failed: {result.stderr}"
@@ -786,9 +821,10 @@ class TestDiffCommand:
             [*envdrift_cmd, "diff", str(env1), str(work_dir / ".env.missing")],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail gracefully with error about missing file
@@ -815,9 +851,10 @@ class TestValidateCommand:
             [*envdrift_cmd, "validate", str(env_file)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle missing schema gracefully
@@ -851,9 +888,10 @@ class Settings(BaseSettings):
             [*envdrift_cmd, "validate", str(env_file), "--schema", str(schema_file)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         assert result.returncode in (0, 1), f"Unexpected error: {result.stderr}"
@@ -882,9 +920,10 @@ class TestConfigEdgeCases:
             [*envdrift_cmd, "encrypt", str(env_file)],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle invalid TOML gracefully
@@ -911,9 +950,10 @@ vault_key_path = "some/path"
             [*envdrift_cmd, "sync"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should handle missing config gracefully
@@ -940,9 +980,10 @@ vault_key_path = "some/path"
             [*envdrift_cmd, "sync"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail with clear error about unknown backend
@@ -982,9 +1023,10 @@ class TestSOPSBackend:
             [*envdrift_cmd, "encrypt", str(env_file), "--backend", "sops"],
             cwd=work_dir,
             env=env,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=CLI_TIMEOUT,
         )
 
         # Should fail gracefully when sops is not available
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import os
-import re
+import shutil
 import subprocess  # nosec B404
 import sys
 import textwrap
+import traceback
 from pathlib import Path
 
 import pytest
+from tests.helpers import strip_ansi
+from typer.testing import CliRunner
+
+from envdrift.cli import app
+from envdrift.integrations.dotenvx import DotenvxInstaller, DotenvxInstallError
+from envdrift.integrations.sops import SopsInstaller, SopsInstallError
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PYTHONPATH = str(REPO_ROOT / "src")
@@ -17,16 +26,131 @@ PYTHONPATH = str(REPO_ROOT / "src")
 AGE_PUBLIC_KEY = "age1c89jtrvyl72y0muvdp5lm3jpemvc2gr303up4g37tuq4uftcku3q4svqau"
 AGE_PRIVATE_KEY = "AGE-SECRET-KEY-1HGE3ZE9NPEN5R76LVKKJ2Z3G9TYZJLW84P2CHAF6UGL43R7TWPUSZ89MK6"
 
+# Fixture file bodies shared by several tests, dedented once at import time.
+_AGE_KEY_FILE = textwrap.dedent(
+    f"""\
+    # created: 2026-01-01T23:59:46-05:00
+    # public key: {AGE_PUBLIC_KEY}
+    {AGE_PRIVATE_KEY}
+    """
+)
+_SOPS_YAML_TEMPLATE = textwrap.dedent(
+    """\
+    creation_rules:
+      - path_regex: {path_regex}
+        age: {age_public_key}
+    """
+)
+_SOPS_TOML_TEMPLATE = textwrap.dedent(
+    """\
+    [encryption]
+    backend = "sops"
+
+    [encryption.sops]
+    auto_install = false
+    config_file = ".sops.yaml"
+    age_key_file = "age.key"
+    age_recipients = "{age_recipients}"
+    """
+)
+_DUMMY_VAULT_SYNC_TOML = textwrap.dedent(
+    """\
 
-def _run_envdrift(args: list[str], *, cwd: Path, env: dict[str, str], check: bool = True):
-    cmd = [sys.executable, "-m", "envdrift.cli", *args]
-    result = subprocess.run(  # nosec B603
-        cmd,
-        cwd=str(cwd),
-        env=env,
-        capture_output=True,
-        text=True,
+    [vault]
+    provider = "azure"
+
+    [vault.azure]
+    vault_url = "https://dummy.vault.azure.net/"
+
+    [vault.sync]
+    default_vault_name = "dummy"
+
+    [[vault.sync.mappings]]
+    secret_name = "unused-for-sops"
+    folder_path = "."
+    environment = "production"
+    """
+)
+_DOTENVX_TOML = textwrap.dedent(
+    """\
+    [encryption]
+    backend = "dotenvx"
+
+    [encryption.dotenvx]
+    auto_install = false
+    """
+)
+_PARTIAL_TOML = textwrap.dedent(
+    """\
+    [partial_encryption]
+    enabled = true
+
+    [[partial_encryption.environments]]
+    name = "production"
+    clear_file = ".env.production.clear"
+    secret_file = ".env.production.secret"
+    combined_file = ".env.production"
+    """
+)
+
+
+def _with_smart_encryption(config: str) -> str:
+    """Return an ``[encryption]`` config with ``smart_encryption`` turned on."""
+    return config.replace("[encryption]\n", "[encryption]\nsmart_encryption = true\n", 1)
+
+
+# Plaintext dotenv bodies are ASCII, so tests write and inspect them as raw
+# bytes: no codec round-trip and no newline translation on Windows.
+_DOTENV_BODY_BYTES = b"API_URL=https://example.com\nAPI_KEY=supersecret\nDEBUG=true\nPORT=3000\n"
+_SOPS_BODY_BYTES = b"DB_USER=admin\nDB_PASSWORD=hunter2\n"
+_SMART_DOTENV_BODY_BYTES = (
+    b"API_URL=https://example.com\nSECRET_KEY=mysupersecretkey123\nDEBUG=false\n"
+)
+
+
+# The CLI runs in-process through Typer's CliRunner by default: these tests
+# exercise envdrift's encrypt/lock/pull logic, and the dotenvx/SOPS binaries are
+# still real child processes spawned by envdrift itself. Set
+# ENVDRIFT_TEST_SUBPROCESS=1 to run every call as a fresh ``python -m
+# envdrift.cli`` child instead (e.g. when chasing import-time or stream state).
+# There is deliberately no long-lived "server" child in between: the in-process
+# path already pays one interpreter start per session, and the opt-in path only
+# exists to get a fresh interpreter per call.
+USE_SUBPROCESS = os.environ.get("ENVDRIFT_TEST_SUBPROCESS") == "1"
+
+_runner = CliRunner()
+
+
+def _envdrift_argv(args: list[str]) -> list[str]:
+    return [sys.executable, "-m", "envdrift.cli", *args]
+
+
+def _invoke_in_process(args: list[str], *, cwd: Path, env: dict[str, str]):
+    # CliRunner only overlays ``env`` on os.environ; map every key the caller
+    # dropped to None so it is unset for the run, exactly as the child would see.
+    overrides = {key: env.get(key) for key in os.environ.keys() | env.keys()}
+    with contextlib.chdir(cwd):
+        result = _runner.invoke(app, args, env=overrides)
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += "".join(traceback.format_exception(result.exception))
+    return subprocess.CompletedProcess(
+        _envdrift_argv(args), result.exit_code, result.stdout, stderr
     )
+
+
+def _run_envdrift(args: list[str], *, cwd: Path, env: dict[str, str], check: bool = True):
+    cmd = _envdrift_argv(args)
+    if USE_SUBPROCESS:
+        result = subprocess.run(  # nosec B603
+            cmd,
+            cwd=str(cwd),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+    else:
+        result = _invoke_in_process(args, cwd=cwd, env=env)
     if check and result.returncode != 0:
         raise AssertionError(
             "envdrift failed\n"
@@ -38,8 +162,43 @@ def _run_envdrift(args: list[str], *, cwd: Path, env: dict[str, str], check: boo
     return result
 
 
+def _preinstall_tooling(bin_dir: Path, search_path: str) -> dict[str, str]:
+    """Install dotenvx and SOPS into *bin_dir* once for the whole session.
+
+    Every config in this module sets ``auto_install = false``, so the binaries
+    are downloaded here instead of by whichever test happens to run first.
+    Tools already on *search_path* (CI installs them up front) are left alone.
+    Returns the download error for each tool that could not be installed, so
+    the tests needing it fail with that error via ``_require_tool``.
+    """
+    suffix = ".exe" if os.name == "nt" else ""
+    errors: dict[str, str] = {}
+    if shutil.which("dotenvx", path=search_path) is None:
+        try:
+            DotenvxInstaller().download_and_extract(bin_dir / f"dotenvx{suffix}")
+        except DotenvxInstallError as e:
+            errors["dotenvx"] = str(e)
+    if shutil.which("sops", path=search_path) is None:
+        try:
+            SopsInstaller().install(bin_dir / f"sops{suffix}")
+        except SopsInstallError as e:
+            errors["sops"] = str(e)
+    return errors
+
+
+def _require_tool(integration_env, *tools: str) -> None:
+    """Fail up front when the session could not install one of *tools*."""
+    for tool in tools:
+        error = integration_env["install_errors"].get(tool)
+        if error is not None:
+            pytest.fail(f"{tool} pre-install failed: {error}", pytrace=False)
+
+
 @pytest.fixture(scope="session")
 def integration_env(tmp_path_factory):
+    # Session scope is per *worker* under pytest-xdist and tmp_path_factory hands
+    # each worker its own basetemp, so the fixed per-test subdirectories below
+    # never collide when the module is sharded with ``-n auto``.
     base_dir = tmp_path_factory.mktemp("envdrift-integration")
     venv_dir = base_dir / ".venv"
     bin_dir = venv_dir / ("Scripts" if os.name == "nt" else "bin")
@@ -49,114 +208,100 @@ def integration_env(tmp_path_factory):
     env["VIRTUAL_ENV"] = str(venv_dir)
     env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
     env["PYTHONPATH"] = f"{PYTHONPATH}{os.pathsep}{env.get('PYTHONPATH', '')}"
+    # Git run by envdrift (smart encryption) or by the tests never needs the
+    # optional index refresh lock, nor the runner's system/global config: repo
+    # identity comes from the git_template's own .git/config.
+    env["GIT_OPTIONAL_LOCKS"] = "0"
+    env["GIT_CONFIG_NOSYSTEM"] = "1"
+    env["GIT_CONFIG_GLOBAL"] = os.devnull
 
-    return {"base_dir": base_dir, "env": env}
-
+    install_errors = _preinstall_tooling(bin_dir, env["PATH"])
 
-@pytest.mark.integration
-def test_dotenvx_encrypt_decrypt_roundtrip(integration_env):
-    work_dir = integration_env["base_dir"] / "dotenvx"
-    work_dir.mkdir()
-    env = integration_env["env"].copy()
-
-    env_file = work_dir / ".env.dotenvx"
-    env_file.write_text(
-        textwrap.dedent(
-            """\
-            API_URL=https://example.com
-            API_KEY=supersecret
-            DEBUG=true
-            PORT=3000
-            """
-        )
-    )
+    return {"base_dir": base_dir, "env": env, "install_errors": install_errors}
 
-    config = textwrap.dedent(
-        """\
-        [encryption]
-        backend = "dotenvx"
 
-        [encryption.dotenvx]
-        auto_install = true
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """An initialized, identity-configured git repo that tests copy into place.
 
-    result = _run_envdrift(
-        ["encrypt", env_file.name, "--check"],
-        cwd=work_dir,
-        env=env,
-        check=False,
+    ``git init`` runs once per session; the commit identity is written straight
+    into ``.git/config`` so no test needs its own ``git config`` calls. Copying
+    the template spawns no git process at all, which keeps it cheaper per test
+    than a ``git worktree add`` off a shared bare repo.
+    """
+    template = tmp_path_factory.mktemp("git-template") / "repo"
+    template.mkdir()
+    subprocess.run(
+        ["git", "init", "-q", "-b", "main"],
+        cwd=template,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    assert result.returncode == 1
+    with (template / ".git" / "config").open("a", encoding="utf-8") as config:
+        config.write("[user]\n\tname = Test\n\temail = test@test.com\n")
+    return template
 
-    _run_envdrift(["encrypt", env_file.name], cwd=work_dir, env=env)
-    encrypted = env_file.read_text()
-    assert "encrypted:" in encrypted
-    assert "DOTENV_PUBLIC_KEY" in encrypted
 
-    _run_envdrift(["decrypt", env_file.name], cwd=work_dir, env=env)
-    decrypted = env_file.read_text()
-    assert "API_KEY=supersecret" in decrypted
-    assert "encrypted:" not in decrypted
+# Per-backend roundtrip inputs: env filename, plaintext body, extra encrypt
+# arguments, a plaintext line to find after decrypt, and a ciphertext marker.
+_ROUNDTRIP_CASES = {
+    "dotenvx": (".env.dotenvx", _DOTENV_BODY_BYTES, [], b"API_KEY=supersecret", b"encrypted:"),
+    "sops": (".env.sops", _SOPS_BODY_BYTES, ["--backend", "sops"], b"DB_PASSWORD=hunter2", b"ENC["),
+}
 
 
-@pytest.mark.integration
-def test_sops_encrypt_decrypt_roundtrip(integration_env):
-    work_dir = integration_env["base_dir"] / "sops"
+def _write_roundtrip_workspace(work_dir: Path, backend: str) -> Path:
+    """Write the plaintext env file and backend config; return the env file."""
+    filename, body, _, _, _ = _ROUNDTRIP_CASES[backend]
     work_dir.mkdir()
-    env = integration_env["env"].copy()
+    env_file = work_dir / filename
+    env_file.write_bytes(body)
+    if backend == "sops":
+        _write_sops_age_setup(work_dir, path_regex=r"\.env\.sops$")
+        (work_dir / "envdrift.toml").write_text(_sops_encryption_section(AGE_PUBLIC_KEY))
+    else:
+        (work_dir / "envdrift.toml").write_text(_DOTENVX_TOML)
+    return env_file
 
-    env_file = work_dir / ".env.sops"
-    env_file.write_text(
-        textwrap.dedent(
-            """\
-            DB_USER=admin
-            DB_PASSWORD=hunter2
-            """
-        )
-    )
 
-    (work_dir / "age.key").write_text(
-        textwrap.dedent(
-            f"""\
-            # created: 2026-01-01T23:59:46-05:00
-            # public key: {AGE_PUBLIC_KEY}
-            {AGE_PRIVATE_KEY}
-            """
-        )
-    )
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", sorted(_ROUNDTRIP_CASES))
+def test_encrypt_check_reports_plaintext(integration_env, backend):
+    """``encrypt --check`` only analyzes the file, so it needs no encryption."""
+    work_dir = integration_env["base_dir"] / f"{backend}-check"
+    env_file = _write_roundtrip_workspace(work_dir, backend)
+    body = env_file.read_bytes()
+    extra_args = _ROUNDTRIP_CASES[backend][2]
 
-    (work_dir / ".sops.yaml").write_text(
-        textwrap.dedent(
-            f"""\
-            creation_rules:
-              - path_regex: \\.env\\.sops$
-                age: {AGE_PUBLIC_KEY}
-            """
-        )
+    result = _run_envdrift(
+        ["encrypt", env_file.name, *extra_args, "--check"],
+        cwd=work_dir,
+        env=integration_env["env"].copy(),
+        check=False,
     )
+    assert result.returncode == 1
+    assert env_file.read_bytes() == body
 
-    config = textwrap.dedent(
-        f"""\
-        [encryption]
-        backend = "sops"
 
-        [encryption.sops]
-        auto_install = true
-        config_file = ".sops.yaml"
-        age_key_file = "age.key"
-        age_recipients = "{AGE_PUBLIC_KEY}"
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", sorted(_ROUNDTRIP_CASES))
+def test_encrypt_decrypt_roundtrip(integration_env, backend):
+    _require_tool(integration_env, backend)
+    work_dir = integration_env["base_dir"] / backend
+    env_file = _write_roundtrip_workspace(work_dir, backend)
+    _, _, extra_args, plaintext, cipher_marker = _ROUNDTRIP_CASES[backend]
+    env = integration_env["env"].copy()
 
-    _run_envdrift(["encrypt", env_file.name, "--backend", "sops"], cwd=work_dir, env=env)
-    encrypted = env_file.read_text()
-    assert "ENC[" in encrypted
+    _run_envdrift(["encrypt", env_file.name, *extra_args], cwd=work_dir, env=env)
+    encrypted = env_file.read_bytes()
+    assert cipher_marker in encrypted
+    assert plaintext not in encrypted
+    if backend == "dotenvx":
+        assert b"DOTENV_PUBLIC_KEY" in encrypted
 
     check_result = _run_envdrift(
-        ["encrypt", env_file.name, "--backend", "sops", "--check"],
+        ["encrypt", env_file.name, *extra_args, "--check"],
         cwd=work_dir,
         env=env,
         check=False,
@@ -164,31 +309,40 @@ def test_sops_encrypt_decrypt_roundtrip(integration_env):
     assert check_result.returncode == 0
 
     _run_envdrift(["decrypt", env_file.name], cwd=work_dir, env=env)
-    decrypted = env_file.read_text()
-    assert "DB_PASSWORD=hunter2" in decrypted
-    assert "ENC[" not in decrypted
+    decrypted = env_file.read_bytes()
+    assert plaintext in decrypted
+    assert cipher_marker not in decrypted
 
 
 def _write_sops_age_setup(work_dir: Path, *, path_regex: str) -> None:
     """Write age.key and .sops.yaml for a SOPS+age workspace."""
-    (work_dir / "age.key").write_text(
-        textwrap.dedent(
-            f"""\
-            # created: 2026-01-01T23:59:46-05:00
-            # public key: {AGE_PUBLIC_KEY}
-            {AGE_PRIVATE_KEY}
-            """
-        )
-    )
+    (work_dir / "age.key").write_text(_AGE_KEY_FILE)
     (work_dir / ".sops.yaml").write_text(
-        textwrap.dedent(
-            f"""\
-            creation_rules:
-              - path_regex: {path_regex}
-                age: {AGE_PUBLIC_KEY}
-            """
-        )
+        _SOPS_YAML_TEMPLATE.format(path_regex=path_regex, age_public_key=AGE_PUBLIC_KEY)
+    )
+
+
+def _file_digest(path: Path) -> bytes:
+    """Return a short streaming digest of *path* for byte-identity checks."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
+
+def _git_file_unchanged(work_dir: Path, filename: str, *, env: dict[str, str]) -> bool:
+    """Return True when *filename* matches HEAD, answered by exit code alone.
+
+    ``git diff --quiet`` refreshes stale stat info in memory before comparing,
+    so a file rewritten with identical bytes (what smart encryption's restore
+    does) reads as unchanged; plumbing ``diff-index`` would report it dirty.
+    """
+    result = subprocess.run(
+        ["git", "--no-optional-locks", "diff", "--quiet", "HEAD", "--", filename],
+        cwd=work_dir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
+    return result.returncode == 0
 
 
 def _scrub_cloud_credentials(env: dict[str, str]) -> None:
@@ -225,6 +379,7 @@ def test_sops_lock_and_pull_roundtrip(integration_env):
     skips the (dotenvx-only) key-sync step, so this runs with a dummy vault URL and
     no cloud credentials.
     """
+    _require_tool(integration_env, "sops")
     work_dir = integration_env["base_dir"] / "sops-lock-pull"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -242,34 +397,7 @@ def test_sops_lock_and_pull_roundtrip(integration_env):
     )
 
     _write_sops_age_setup(work_dir, path_regex=r"\.env\.production$")
-
-    config = textwrap.dedent(
-        f"""\
-        [encryption]
-        backend = "sops"
-
-        [encryption.sops]
-        auto_install = true
-        config_file = ".sops.yaml"
-        age_key_file = "age.key"
-        age_recipients = "{AGE_PUBLIC_KEY}"
-
-        [vault]
-        provider = "azure"
-
-        [vault.azure]
-        vault_url = "https://dummy.vault.azure.net/"
-
-        [vault.sync]
-        default_vault_name = "dummy"
-
-        [[vault.sync.mappings]]
-        secret_name = "unused-for-sops"
-        folder_path = "."
-        environment = "production"
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
+    _write_sops_vault_sync_toml(work_dir, age_recipients=AGE_PUBLIC_KEY)
 
     # lock encrypts the SOPS file in place (no vault contact).
     _run_envdrift(["lock", "--force"], cwd=work_dir, env=env)
@@ -287,6 +415,7 @@ def test_sops_lock_and_pull_roundtrip(integration_env):
 @pytest.mark.integration
 def test_dotenvx_lock_pull_custom_env_files_use_canonical_keys(integration_env):
     """Custom vault.sync env_file names keep key names based on environment."""
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "dotenvx-custom-lock-pull"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -308,7 +437,7 @@ def test_dotenvx_lock_pull_custom_env_files_use_canonical_keys(integration_env):
         backend = "dotenvx"
 
         [encryption.dotenvx]
-        auto_install = true
+        auto_install = false
 
         [vault]
         provider = "azure"
@@ -386,20 +515,7 @@ def test_sops_lock_pull_require_vault_sync_config(integration_env):
     _write_sops_age_setup(work_dir, path_regex=r"\.env\.production$")
 
     # No [vault] / [vault.sync] sections.
-    (work_dir / "envdrift.toml").write_text(
-        textwrap.dedent(
-            f"""\
-            [encryption]
-            backend = "sops"
-
-            [encryption.sops]
-            auto_install = true
-            config_file = ".sops.yaml"
-            age_key_file = "age.key"
-            age_recipients = "{AGE_PUBLIC_KEY}"
-            """
-        )
-    )
+    (work_dir / "envdrift.toml").write_text(_sops_encryption_section(AGE_PUBLIC_KEY))
 
     lock_result = _run_envdrift(["lock", "--force"], cwd=work_dir, env=env, check=False)
     assert lock_result.returncode != 0
@@ -434,7 +550,7 @@ def test_sops_plain_pull_runs_dotenvx_key_sync_step(integration_env):
         backend = "sops"
 
         [encryption.sops]
-        auto_install = true
+        auto_install = false
         config_file = ".sops.yaml"
         age_key_file = "age.key"
         age_recipients = "{AGE_PUBLIC_KEY}"
@@ -466,241 +582,156 @@ def test_sops_plain_pull_runs_dotenvx_key_sync_step(integration_env):
     assert env_file.read_text() == "API_KEY=topsecret\n"
 
 
-@pytest.mark.integration
-def test_dotenvx_smart_encryption_skips_unchanged(integration_env):
-    """Smart encryption should restore from git when content is unchanged.
+@pytest.fixture(scope="session")
+def dotenvx_smart_project(integration_env):
+    """A smart-encryption dotenvx project, encrypted once per session.
 
-    This tests the fix for dotenvx's non-deterministic encryption (ECIES)
-    which produces different ciphertext each time, causing unnecessary git noise.
+    Tests copy this directory (encrypted file, .env.keys, config) over a fresh
+    git repo instead of paying for the first dotenvx encrypt themselves.
     """
-    work_dir = integration_env["base_dir"] / "dotenvx-smart"
-    work_dir.mkdir()
-    env = integration_env["env"].copy()
+    _require_tool(integration_env, "dotenvx")
+    project = integration_env["base_dir"] / "dotenvx-smart-cache"
+    project.mkdir()
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=work_dir, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
-    )
+    env_file = project / ".env.production"
+    env_file.write_bytes(_SMART_DOTENV_BODY_BYTES)
 
-    # Create env file
-    env_file = work_dir / ".env.production"
-    env_file.write_text(
-        textwrap.dedent(
-            """\
-            API_URL=https://example.com
-            SECRET_KEY=mysupersecretkey123
-            DEBUG=false
-            """
-        )
-    )
+    (project / "envdrift.toml").write_text(_with_smart_encryption(_DOTENVX_TOML))
 
-    # Create config with smart_encryption enabled
-    config = textwrap.dedent(
-        """\
-        [encryption]
-        backend = "dotenvx"
-        smart_encryption = true
+    _run_envdrift(["encrypt", env_file.name], cwd=project, env=integration_env["env"].copy())
+    assert b"encrypted:" in env_file.read_bytes()
+    return project
 
-        [encryption.dotenvx]
-        auto_install = true
-        """
+
+@pytest.fixture(scope="session")
+def sops_smart_project(integration_env):
+    """A smart-encryption SOPS project, encrypted once per session."""
+    _require_tool(integration_env, "sops")
+    project = integration_env["base_dir"] / "sops-smart-cache"
+    project.mkdir()
+
+    _write_sops_age_setup(project, path_regex=r"\.env\.sops$")
+
+    env_file = project / ".env.sops"
+    env_file.write_bytes(b"TEST_VAR=original_value")
+
+    (project / "envdrift.toml").write_text(
+        _with_smart_encryption(_SOPS_TOML_TEMPLATE.format(age_recipients=AGE_PUBLIC_KEY))
     )
-    (work_dir / "envdrift.toml").write_text(config)
 
-    # Encrypt the file
-    _run_envdrift(["encrypt", env_file.name], cwd=work_dir, env=env)
-    encrypted_content_v1 = env_file.read_text()
-    assert "encrypted:" in encrypted_content_v1
+    _run_envdrift(["encrypt", env_file.name], cwd=project, env=integration_env["env"].copy())
+    assert b"ENC[" in env_file.read_bytes()
+    return project
+
+
+# Per-backend smart-encryption inputs: env filename, the extra project files to
+# commit alongside it, a plaintext line to find after decrypt, and a ciphertext
+# marker.
+_SMART_CASES = {
+    "dotenvx": (
+        ".env.production",
+        ("envdrift.toml",),
+        b"SECRET_KEY=mysupersecretkey123",
+        b"encrypted:",
+    ),
+    "sops": (
+        ".env.sops",
+        ("envdrift.toml", ".sops.yaml", "age.key"),
+        b"TEST_VAR=original_value",
+        b"ENC[",
+    ),
+}
+
+
+def _assert_smart_encryption_skips_unchanged(
+    integration_env, git_template, backend: str, project: Path
+) -> None:
+    """Smart encryption should restore from git when content is unchanged.
+
+    Both dotenvx (ECIES) and SOPS (fresh IV/mac) produce different ciphertext
+    on every run, which would otherwise cause unnecessary git noise.
+    """
+    filename, tracked_files, plaintext, cipher_marker = _SMART_CASES[backend]
+    work_dir = integration_env["base_dir"] / f"{backend}-smart"
+    shutil.copytree(git_template, work_dir)
+    shutil.copytree(project, work_dir, dirs_exist_ok=True)
+    env = integration_env["env"].copy()
+
+    env_file = work_dir / filename
+    encrypted_digest = _file_digest(env_file)
 
     # Commit the encrypted file to git
     subprocess.run(
-        ["git", "add", ".env.production", "envdrift.toml"],
+        ["git", "add", filename, *tracked_files],
         cwd=work_dir,
-        capture_output=True,
+        env=env,
         check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     subprocess.run(
-        ["git", "commit", "-m", "initial"],
+        ["git", "commit", "-q", "--no-gpg-sign", "--no-verify", "-m", "initial"],
         cwd=work_dir,
-        capture_output=True,
+        env=env,
         check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     # Decrypt the file (simulating `envdrift pull`)
     _run_envdrift(["decrypt", env_file.name], cwd=work_dir, env=env)
-    decrypted_content = env_file.read_text()
-    assert "SECRET_KEY=mysupersecretkey123" in decrypted_content
-    assert "encrypted:" not in decrypted_content
+    decrypted_content = env_file.read_bytes()
+    assert plaintext in decrypted_content
+    assert cipher_marker not in decrypted_content
 
     # Now re-encrypt WITHOUT changing the content
     # The smart encryption should detect the content is unchanged
     # and restore the original encrypted file from git
     _run_envdrift(["encrypt", env_file.name], cwd=work_dir, env=env)
-    encrypted_content_v2 = env_file.read_text()
 
-    # The encrypted content should be IDENTICAL to v1 (restored from git)
-    # If smart encryption works, the file should not have changed
-    assert encrypted_content_v2 == encrypted_content_v1, (
+    # The encrypted content should be IDENTICAL to the committed file
+    assert _file_digest(env_file) == encrypted_digest, (
         "Smart encryption should restore original encrypted file when content unchanged. "
         "Got different ciphertext, meaning file was re-encrypted instead of restored."
     )
 
     # Verify git shows no changes
-    result = subprocess.run(
-        ["git", "status", "--porcelain", ".env.production"],
-        cwd=work_dir,
-        capture_output=True,
-        text=True,
-    )
-    assert result.stdout.strip() == "", (
-        f"File should have no git changes after smart encryption, but got: {result.stdout}"
+    assert _git_file_unchanged(work_dir, env_file.name, env=env), (
+        "File should have no git changes after smart encryption"
     )
 
 
+# One test per backend, each naming its own session project: a single-backend
+# run (``-k dotenvx``) never encrypts the other backend's project.
 @pytest.mark.integration
-def test_sops_smart_encryption_skips_unchanged(integration_env):
-    """Smart encryption should work for sops as well.
-
-    SOPS also produces non-deterministic output (different IV/mac) each time.
-    """
-    work_dir = integration_env["base_dir"] / "sops-smart"
-    work_dir.mkdir()
-    env = integration_env["env"].copy()
-
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=work_dir, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
+def test_smart_encryption_skips_unchanged_dotenvx(
+    integration_env, git_template, dotenvx_smart_project
+):
+    """Smart encryption restores the committed dotenvx file when content is unchanged."""
+    _assert_smart_encryption_skips_unchanged(
+        integration_env, git_template, "dotenvx", dotenvx_smart_project
     )
 
-    # Setup sops keys
-    (work_dir / "age.key").write_text(
-        textwrap.dedent(
-            f"""\
-            # created: 2026-01-01T23:59:46-05:00
-            # public key: {AGE_PUBLIC_KEY}
-            {AGE_PRIVATE_KEY}
-            """
-        )
-    )
 
-    (work_dir / ".sops.yaml").write_text(
-        textwrap.dedent(
-            f"""\
-            creation_rules:
-              - path_regex: \\.env\\.sops$
-                age: {AGE_PUBLIC_KEY}
-            """
-        )
-    )
-
-    # Create env file
-    env_file = work_dir / ".env.sops"
-    env_file.write_text("TEST_VAR=original_value")
-
-    # Create config with smart_encryption enabled
-    config = textwrap.dedent(
-        f"""\
-        [encryption]
-        backend = "sops"
-        smart_encryption = true
-
-        [encryption.sops]
-        auto_install = true
-        config_file = ".sops.yaml"
-        age_key_file = "age.key"
-        age_recipients = "{AGE_PUBLIC_KEY}"
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
-
-    # Encrypt
-    _run_envdrift(["encrypt", env_file.name], cwd=work_dir, env=env)
-    encrypted_content_v1 = env_file.read_text()
-    assert "ENC[" in encrypted_content_v1
-
-    # Commit
-    subprocess.run(
-        ["git", "add", ".env.sops", "envdrift.toml", ".sops.yaml", "age.key"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", "initial"],
-        cwd=work_dir,
-        capture_output=True,
-        check=True,
-    )
-
-    # Decrypt
-    _run_envdrift(["decrypt", env_file.name], cwd=work_dir, env=env)
-    decrypted_content = env_file.read_text()
-    assert "TEST_VAR=original_value" in decrypted_content
-    assert "ENC[" not in decrypted_content
-
-    # Re-encrypt
-    _run_envdrift(["encrypt", env_file.name], cwd=work_dir, env=env)
-    encrypted_content_v2 = env_file.read_text()
-
-    # Should be identical (restored from git)
-    assert encrypted_content_v2 == encrypted_content_v1, (
-        "Smart encryption should restore sops file when content unchanged."
-    )
-
-    # Verify git status clean
-    result = subprocess.run(
-        ["git", "status", "--porcelain", ".env.sops"],
-        cwd=work_dir,
-        capture_output=True,
-        text=True,
+@pytest.mark.integration
+def test_smart_encryption_skips_unchanged_sops(integration_env, git_template, sops_smart_project):
+    """Smart encryption restores the committed SOPS file when content is unchanged."""
+    _assert_smart_encryption_skips_unchanged(
+        integration_env, git_template, "sops", sops_smart_project
     )
-    assert result.stdout.strip() == ""
 
 
 @pytest.mark.integration
-def test_partial_push_updates_gitignore(integration_env):
+def test_partial_push_updates_gitignore(integration_env, git_template):
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "partial-gitignore"
-    work_dir.mkdir()
+    shutil.copytree(git_template, work_dir)
     env = integration_env["env"].copy()
 
-    subprocess.run(["git", "init"], cwd=work_dir, capture_output=True, check=True)
-
     (work_dir / ".env.production.clear").write_text("APP_VERSION=1.2.3\n")
     (work_dir / ".env.production.secret").write_text("SECRET=encrypted:dummy\n")
 
-    config = textwrap.dedent(
-        """\
-        [partial_encryption]
-        enabled = true
-
-        [[partial_encryption.environments]]
-        name = "production"
-        clear_file = ".env.production.clear"
-        secret_file = ".env.production.secret"
-        combined_file = ".env.production"
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
+    (work_dir / "envdrift.toml").write_text(_PARTIAL_TOML)
 
     _run_envdrift(["push", "--env", "production"], cwd=work_dir, env=env)
 
@@ -711,31 +742,18 @@ def test_partial_push_updates_gitignore(integration_env):
 
 
 @pytest.mark.integration
-def test_partial_push_respects_existing_gitignore(integration_env):
+def test_partial_push_respects_existing_gitignore(integration_env, git_template):
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "partial-gitignore-existing"
-    work_dir.mkdir()
+    shutil.copytree(git_template, work_dir)
     env = integration_env["env"].copy()
 
-    subprocess.run(["git", "init"], cwd=work_dir, capture_output=True, check=True)
-
     (work_dir / ".env.production.clear").write_text("APP_VERSION=1.2.3\n")
     (work_dir / ".env.production.secret").write_text("SECRET=encrypted:dummy\n")
     gitignore_path = work_dir / ".gitignore"
     gitignore_path.write_text(".env.*\n")
 
-    config = textwrap.dedent(
-        """\
-        [partial_encryption]
-        enabled = true
-
-        [[partial_encryption.environments]]
-        name = "production"
-        clear_file = ".env.production.clear"
-        secret_file = ".env.production.secret"
-        combined_file = ".env.production"
-        """
-    )
-    (work_dir / "envdrift.toml").write_text(config)
+    (work_dir / "envdrift.toml").write_text(_PARTIAL_TOML)
 
     _run_envdrift(["push", "--env", "production"], cwd=work_dir, env=env)
 
@@ -745,6 +763,7 @@ def test_partial_push_respects_existing_gitignore(integration_env):
 @pytest.mark.integration
 def test_pull_skips_partial_combined_files(integration_env):
     pytest.importorskip("boto3")
+    _require_tool(integration_env, "dotenvx")
 
     work_dir = integration_env["base_dir"] / "pull-partial-skip"
     work_dir.mkdir()
@@ -777,7 +796,7 @@ def test_pull_skips_partial_combined_files(integration_env):
         backend = "dotenvx"
 
         [encryption.dotenvx]
-        auto_install = true
+        auto_install = false
         """
     )
     (work_dir / "envdrift.toml").write_text(config)
@@ -788,7 +807,7 @@ def test_pull_skips_partial_combined_files(integration_env):
         env=env,
     )
 
-    output = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout + result.stderr)
+    output = strip_ansi(result.stdout + result.stderr)
     assert "skipped (partial encryption combined file)" in output
 
 
@@ -806,6 +825,7 @@ def test_full_lock_pull_merge_cycle(integration_env):
     """
     pytest.importorskip("azure.identity", reason="Azure SDK not installed")
     pytest.importorskip("azure.keyvault.secrets", reason="Azure Key Vault SDK not installed")
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "lock-pull-merge-cycle"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -845,7 +865,7 @@ def test_full_lock_pull_merge_cycle(integration_env):
         backend = "dotenvx"
 
         [encryption.dotenvx]
-        auto_install = true
+        auto_install = false
 
         [vault]
         provider = "azure"
@@ -882,7 +902,7 @@ def test_full_lock_pull_merge_cycle(integration_env):
         cwd=work_dir,
         env=env,
     )
-    output = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout + result.stderr)
+    output = strip_ansi(result.stdout + result.stderr)
     assert "encrypted" in output.lower(), f"Expected 'encrypted' in output: {output}"
 
     # Verify .secret file is encrypted
@@ -899,7 +919,7 @@ def test_full_lock_pull_merge_cycle(integration_env):
         cwd=work_dir,
         env=env,
     )
-    output = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout + result.stderr)
+    output = strip_ansi(result.stdout + result.stderr)
     assert "merged" in output.lower(), f"Expected 'merged' in output: {output}"
 
     # Verify combined file exists and has decrypted content
@@ -920,7 +940,7 @@ def test_full_lock_pull_merge_cycle(integration_env):
         cwd=work_dir,
         env=env,
     )
-    output = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout + result.stderr)
+    output = strip_ansi(result.stdout + result.stderr)
     assert "deleted" in output.lower(), f"Expected 'deleted' in output: {output}"
 
     # Verify combined file is deleted
@@ -968,7 +988,7 @@ def _write_custom_filename_project(work_dir: Path) -> None:
             backend = "dotenvx"
 
             [encryption.dotenvx]
-            auto_install = true
+            auto_install = false
 
             [vault]
             provider = "azure"
@@ -995,6 +1015,7 @@ def test_lock_autodetects_custom_dotenv_filenames(integration_env):
     from the mapping environment — not the non-canonical name dotenvx derives from
     the filename (e.g. `DOTENV_PRIVATE_KEY_POSTGRESQLPRODUCTION`).
     """
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "vault-sync-custom"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1003,7 +1024,7 @@ def test_lock_autodetects_custom_dotenv_filenames(integration_env):
 
     # check=True asserts a clean exit (no "No .env file found" skips, no errors).
     result = _run_envdrift(["lock", "--force"], cwd=work_dir, env=env)
-    output = re.sub(r"\x1b\[[0-9;]*m", "", result.stdout + result.stderr)
+    output = strip_ansi(result.stdout + result.stderr)
     assert "Encrypted: 3" in output, output
 
     for folder, filename, _env, _plain, suffix in _CUSTOM_FILENAME_CASES:
@@ -1030,6 +1051,7 @@ def test_lock_custom_filename_decrypt_roundtrip(integration_env):
     Proves the normalized canonical key in `.env.keys` actually decrypts the file,
     despite dotenvx deriving its key name from the (custom) filename.
     """
+    _require_tool(integration_env, "dotenvx")
     work_dir = integration_env["base_dir"] / "vault-sync-roundtrip"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1056,18 +1078,7 @@ def test_lock_custom_filename_decrypt_roundtrip(integration_env):
 def _sops_encryption_section(age_recipients: str) -> str:
     """The [encryption]/[encryption.sops] TOML block shared by the sops helpers,
     so the two config writers cannot drift as the schema evolves."""
-    return textwrap.dedent(
-        f"""\
-        [encryption]
-        backend = "sops"
-
-        [encryption.sops]
-        auto_install = true
-        config_file = ".sops.yaml"
-        age_key_file = "age.key"
-        age_recipients = "{age_recipients}"
-        """
-    )
+    return _SOPS_TOML_TEMPLATE.format(age_recipients=age_recipients)
 
 
 def _write_sops_toml(work_dir: Path) -> None:
@@ -1083,6 +1094,7 @@ def test_sops_encrypt_cli_truthful_on_plaintext_leak(integration_env):
     and exit 0 while a newly appended plaintext secret stays unencrypted in a
     SOPS-metadata-bearing file. The honest no-op re-run keeps exit 0 but says
     "already encrypted", not "Encrypted"."""
+    _require_tool(integration_env, "sops")
     work_dir = integration_env["base_dir"] / "sops-475-leak"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1121,6 +1133,7 @@ def test_sops_encrypt_cli_refuses_double_encrypting_dotenvx_file(integration_env
     """Regression for #475: with a dotenvx-encrypted file and `backend = "sops"`
     configured, `envdrift encrypt` must refuse instead of silently nesting SOPS
     over dotenvx (which bricks decrypt auto-detection)."""
+    _require_tool(integration_env, "dotenvx", "sops")
     work_dir = integration_env["base_dir"] / "sops-475-nesting"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1134,7 +1147,7 @@ def test_sops_encrypt_cli_refuses_double_encrypting_dotenvx_file(integration_env
             backend = "dotenvx"
 
             [encryption.dotenvx]
-            auto_install = true
+            auto_install = false
             """
         ),
         encoding="utf-8",
@@ -1165,6 +1178,7 @@ def test_sops_encrypt_cli_refuses_double_encrypting_dotenvx_file(integration_env
 def test_sops_lock_fails_on_surviving_plaintext(integration_env):
     """Regression for #475: `envdrift lock` must not bless a SOPS file "ready to
     commit" while a newly appended plaintext value survives in it."""
+    _require_tool(integration_env, "sops")
     work_dir = integration_env["base_dir"] / "sops-475-lock"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1181,7 +1195,7 @@ def test_sops_lock_fails_on_surviving_plaintext(integration_env):
             backend = "sops"
 
             [encryption.sops]
-            auto_install = true
+            auto_install = false
             config_file = ".sops.yaml"
             age_key_file = "age.key"
             age_recipients = "{AGE_PUBLIC_KEY}"
@@ -1225,25 +1239,7 @@ def _write_sops_vault_sync_toml(work_dir: Path, *, age_recipients: str) -> None:
     """envdrift.toml with SOPS encryption plus the [vault.sync] section that
     `lock`/`pull` require (dummy vault, never contacted with --force/--skip-sync)."""
     (work_dir / "envdrift.toml").write_text(
-        _sops_encryption_section(age_recipients)
-        + textwrap.dedent(
-            """\
-
-            [vault]
-            provider = "azure"
-
-            [vault.azure]
-            vault_url = "https://dummy.vault.azure.net/"
-
-            [vault.sync]
-            default_vault_name = "dummy"
-
-            [[vault.sync.mappings]]
-            secret_name = "unused-for-sops"
-            folder_path = "."
-            environment = "production"
-            """
-        ),
+        _sops_encryption_section(age_recipients) + _DUMMY_VAULT_SYNC_TOML,
         encoding="utf-8",
     )
 
@@ -1254,6 +1250,7 @@ def test_sops_pull_fails_loudly_on_surviving_plaintext(integration_env):
     file (metadata + a plaintext value appended after encryption) must fail
     loudly via sops, not print "skipped (not encrypted)" and exit 0 while the
     file's values are still ciphertext."""
+    _require_tool(integration_env, "sops")
     work_dir = integration_env["base_dir"] / "sops-475-pull-mixed"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -1292,6 +1289,7 @@ def test_sops_lock_fails_on_missing_requested_recipient(integration_env):
     ``age_recipients`` in envdrift.toml and re-running `envdrift lock` must fail
     loudly while the file's SOPS metadata does not include the new key —
     "ready to commit" would mean the new teammate silently never got access."""
+    _require_tool(integration_env, "sops")
     work_dir = integration_env["base_dir"] / "sops-475-lock-recipient"
     work_dir.mkdir()
     env = integration_env["env"].copy()
@@ -2,10 +2,36 @@
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import pytest
 
 from envdrift.config import EnvdriftConfig, GuardConfig, load_config
 
+# Read-only [guard] sections shared across tests; parse them through
+# _config_with_guard so each test gets its own mutable copy.
+_GUARD_DATA_FULL: Mapping[str, Any] = MappingProxyType(
+    {
+        "scanners": ["native", "gitleaks", "trufflehog"],
+        "auto_install": False,
+        "include_history": True,
+        "check_entropy": True,
+        "entropy_threshold": 5.5,
+        "fail_on_severity": "critical",
+        "ignore_paths": ["tests/**", "*.test.py"],
+        "verify_secrets": True,
+    }
+)
+
+
+def _config_with_guard(guard: Mapping[str, Any]) -> EnvdriftConfig:
+    """Build an EnvdriftConfig from a deep copy of a shared ``[guard]`` section."""
+    return EnvdriftConfig.from_dict({"envdrift": {}, "guard": copy.deepcopy(dict(guard))})
+
 
 class TestGuardConfigDataclass:
     """Tests for GuardConfig dataclass."""
@@ -71,20 +97,7 @@ class TestEnvdriftConfigWithGuard:
 
     def test_from_dict_parses_guard_section(self):
         """Test that from_dict correctly parses guard section."""
-        data = {
-            "envdrift": {},
-            "guard": {
-                "scanners": ["native", "gitleaks", "trufflehog"],
-                "auto_install": False,
-                "include_history": True,
-                "check_entropy": True,
-                "entropy_threshold": 5.5,
-                "fail_on_severity": "critical",
-                "ignore_paths": ["tests/**", "*.test.py"],
-                "verify_secrets": True,
-            },
-        }
-        config = EnvdriftConfig.from_dict(data)
+        config = _config_with_guard(_GUARD_DATA_FULL)
 
         assert config.guard.scanners == ["native", "gitleaks", "trufflehog"]
         assert config.guard.auto_install is False
@@ -103,25 +116,29 @@ class TestEnvdriftConfigWithGuard:
         assert config.guard.scanners == ["native", "gitleaks"]
         assert config.guard.auto_install is True
 
-    def test_from_dict_handles_string_scanner(self):
-        """Test that single scanner string is converted to list."""
-        data = {
-            "envdrift": {},
-            "guard": {
-                "scanners": "native",  # String instead of list
-            },
-        }
-        config = EnvdriftConfig.from_dict(data)
-        assert config.guard.scanners == ["native"]
+    @pytest.mark.parametrize(
+        ("scanners_in", "scanners_out"),
+        [
+            ("native", ["native"]),  # String instead of list
+            ("gitleaks", ["gitleaks"]),
+            (["native"], ["native"]),
+            (["native", "gitleaks"], ["native", "gitleaks"]),
+            (["native", "gitleaks", "trufflehog"], ["native", "gitleaks", "trufflehog"]),
+        ],
+    )
+    def test_from_dict_normalizes_scanners(self, scanners_in, scanners_out):
+        """Test that scanners accepts a single string or a list of names."""
+        config = _config_with_guard({"scanners": scanners_in})
+        assert config.guard.scanners == scanners_out
+        assert config.guard.scanners_explicit is True
 
 
 class TestLoadConfigWithGuard:
     """Tests for load_config with guard section."""
 
-    def test_load_config_without_file_returns_defaults(self, tmp_path: Path, monkeypatch):
+    def test_load_config_without_file_returns_defaults(self, tmp_path: Path):
         """Test that load_config returns defaults when no config file."""
-        monkeypatch.chdir(tmp_path)
-        config = load_config()
+        config = load_config(start_dir=tmp_path)
         assert config.guard.scanners == ["native", "gitleaks"]
 
     def test_load_config_with_guard_section(self, tmp_path: Path):
@@ -146,7 +163,7 @@ ignore_paths = ["vendor/**"]
         assert config.guard.fail_on_severity == "medium"
         assert config.guard.ignore_paths == ["vendor/**"]
 
-    def test_load_config_from_pyproject_guard_section(self, tmp_path: Path, monkeypatch):
+    def test_load_config_from_pyproject_guard_section(self, tmp_path: Path):
         """Test loading guard settings from pyproject.toml."""
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("""
@@ -159,7 +176,6 @@ include_history = true
 fail_on_severity = "medium"
 ignore_paths = ["vendor/**"]
 """)
-        monkeypatch.chdir(tmp_path)
         config = load_config(pyproject)
 
         assert config.guard.scanners == ["native", "trufflehog"]
@@ -252,7 +268,7 @@ ignore_paths = ["**/tests/**", "**/fixtures/**"]
             "ftp-password": ["**/*.json"],
         }
 
-    def test_load_config_from_pyproject_with_new_features(self, tmp_path: Path, monkeypatch):
+    def test_load_config_from_pyproject_with_new_features(self, tmp_path: Path):
         """Test loading new features from pyproject.toml."""
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("""
@@ -266,7 +282,6 @@ skip_clear_files = true
 [tool.envdrift.guard.ignore_rules]
 "ftp-password" = ["**/*.json"]
 """)
-        monkeypatch.chdir(tmp_path)
         config = load_config(pyproject)
 
         assert config.guard.skip_clear_files is True
@@ -9,14 +9,25 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from envdrift.scanner.base import FindingSeverity, ScanFinding
-from envdrift.scanner.engine import GuardConfig, ScanEngine
+from envdrift.scanner.engine import ScanEngine
+
+# File paths used across the dedup scenarios, built once at import.
+_P_CONFIG = Path("config.py")
+_P_CONFIG1 = Path("config1.py")
+_P_CONFIG2 = Path("config2.py")
+_P_A = Path("a.py")
+_P_B = Path("b.py")
+_P_C = Path("c.py")
+_P_POLICY = Path("policy.json")
 
 
 def _finding(
     scanner: str,
     *,
-    file_path: str = "config.py",
+    file_path: Path = _P_CONFIG,
     rule_id: str = "secret",
     severity: FindingSeverity = FindingSeverity.HIGH,
     line_number: int | None = 10,
@@ -31,7 +42,7 @@ def _finding(
     severity, no secret value. Dedup keys depend on
     ``file_path`` / ``line_number`` / ``rule_id`` / ``secret_hash``, so each test
     overrides exactly the fields that define its scenario and leaves the rest at
-    these defaults. ``file_path`` may be passed as a ``str``.
+    these defaults. ``file_path`` takes one of the module's ``_P_*`` constants.
 
     The keyword arguments map one-to-one onto the ``ScanFinding`` fields a test
     can vary; they are explicit (rather than ``**kwargs``) so the type checker
@@ -40,7 +51,7 @@ def _finding(
     """
     return ScanFinding(
         scanner=scanner,
-        file_path=Path(file_path),
+        file_path=file_path,
         rule_id=rule_id,
         rule_description="Secret",
         description="Secret",
@@ -53,59 +64,51 @@ def _finding(
     )
 
 
-def _dedup(findings: list[ScanFinding], **config_overrides) -> list[ScanFinding]:
-    """Run findings through ``_deduplicate`` with a native-only engine."""
-    config = GuardConfig(use_native=True, use_gitleaks=False, **config_overrides)
-    return ScanEngine(config)._deduplicate(findings)
+def _dedup(findings: list[ScanFinding], *, skip_duplicate: bool = False) -> list[ScanFinding]:
+    """Run findings through ``_deduplicate``; no engine instance is needed."""
+    return ScanEngine._deduplicate(findings, skip_duplicate=skip_duplicate)
 
 
 class TestDeduplication:
     """Tests for finding deduplication."""
 
-    def test_deduplicate_identical_findings(self):
-        """Identical findings (same key) collapse to one."""
-        findings = [
-            _finding("scanner1", rule_id="aws-key", severity=FindingSeverity.CRITICAL),
-            _finding("scanner2", rule_id="aws-key", severity=FindingSeverity.CRITICAL),
-        ]
-
-        assert len(_dedup(findings)) == 1
-
-    def test_deduplicate_keeps_higher_severity(self):
-        """The higher-severity finding wins when keys match."""
-        findings = [
-            _finding("scanner1", severity=FindingSeverity.MEDIUM),
-            _finding("scanner2", severity=FindingSeverity.CRITICAL),
-        ]
-
-        unique = _dedup(findings)
-
-        assert len(unique) == 1
-        assert unique[0].severity == FindingSeverity.CRITICAL
-
-    def test_deduplicate_prefers_verified(self):
-        """A verified finding is preferred over an unverified one at the same key."""
-        findings = [
-            _finding("scanner1", verified=False),
-            _finding("scanner2", verified=True),
-        ]
-
-        unique = _dedup(findings)
-
-        assert len(unique) == 1
-        assert unique[0].verified is True
-
-    def test_deduplicate_prefers_secret_hash(self):
-        """A finding with a secret_hash is preferred when otherwise tied."""
-        findings = [
-            _finding("scanner1", verified=False),
-            _finding("scanner2", verified=False, secret_hash="hash-123"),
-        ]
-
-        unique = _dedup(findings)
+    @pytest.mark.parametrize(
+        ("first", "second", "winner"),
+        [
+            pytest.param(
+                _finding("scanner1", rule_id="aws-key", severity=FindingSeverity.CRITICAL),
+                _finding("scanner2", rule_id="aws-key", severity=FindingSeverity.CRITICAL),
+                "scanner1",
+                id="identical-tie-break",
+            ),
+            pytest.param(
+                _finding("scanner1", severity=FindingSeverity.MEDIUM),
+                _finding("scanner2", severity=FindingSeverity.CRITICAL),
+                "scanner2",
+                id="higher-severity",
+            ),
+            pytest.param(
+                _finding("scanner1", verified=False),
+                _finding("scanner2", verified=True),
+                "scanner2",
+                id="verified",
+            ),
+            pytest.param(
+                _finding("scanner1", verified=False),
+                _finding("scanner2", verified=False, secret_hash="hash-123"),
+                "scanner2",
+                id="secret-hash",
+            ),
+        ],
+    )
+    def test_deduplicate_same_key_keeps_preferred(self, first, second, winner):
+        """Findings sharing a key collapse to one preferred finding, in either order.
 
-        assert len(unique) == 1
-        assert unique[0].secret_hash == "hash-123"
+        Preference: higher severity, then verified, then a real secret_hash, then
+        the deterministic tie-break (lowest scanner name for identical findings).
+        """
+        assert [f.scanner for f in _dedup([first, second])] == [winner]
+        assert [f.scanner for f in _dedup([second, first])] == [winner]
 
     def test_deduplicate_distinct_secrets_same_line_both_kept(self):
         """Two distinct secrets on the same line, same rule, are both kept (#348).
@@ -230,8 +233,8 @@ class TestDeduplication:
     def test_deduplicate_different_locations(self):
         """Findings at different locations are both kept."""
         findings = [
-            _finding("native", file_path="config1.py"),
-            _finding("native", file_path="config2.py"),
+            _finding("native", file_path=_P_CONFIG1),
+            _finding("native", file_path=_P_CONFIG2),
         ]
 
         assert len(_dedup(findings)) == 2
@@ -239,11 +242,11 @@ class TestDeduplication:
     def test_deduplicate_sorted_by_severity(self):
         """Results are sorted by severity, highest first."""
         findings = [
-            _finding("native", file_path="a.py", rule_id="low", severity=FindingSeverity.LOW),
+            _finding("native", file_path=_P_A, rule_id="low", severity=FindingSeverity.LOW),
             _finding(
-                "native", file_path="b.py", rule_id="critical", severity=FindingSeverity.CRITICAL
+                "native", file_path=_P_B, rule_id="critical", severity=FindingSeverity.CRITICAL
             ),
-            _finding("native", file_path="c.py", rule_id="medium", severity=FindingSeverity.MEDIUM),
+            _finding("native", file_path=_P_C, rule_id="medium", severity=FindingSeverity.MEDIUM),
         ]
 
         unique = _dedup(findings)
@@ -264,13 +267,13 @@ class TestDeduplication:
         findings = [
             _finding(
                 "native",
-                file_path="config1.py",
+                file_path=_P_CONFIG1,
                 rule_id="aws-key",
                 secret_preview="AKIA****XXXX",
             ),
             _finding(
                 "gitleaks",
-                file_path="config2.py",
+                file_path=_P_CONFIG2,
                 line_number=20,
                 rule_id="aws-key",
                 secret_preview="AKIA****XXXX",  # Same secret value
@@ -285,13 +288,13 @@ class TestDeduplication:
         findings = [
             _finding(
                 "native",
-                file_path="config1.py",
+                file_path=_P_CONFIG1,
                 secret_preview="PREVIEW-1",
                 secret_hash="hash-xyz",
             ),
             _finding(
                 "gitleaks",
-                file_path="config2.py",
+                file_path=_P_CONFIG2,
                 line_number=20,
                 secret_preview="PREVIEW-2",
                 secret_hash="hash-xyz",
@@ -306,14 +309,14 @@ class TestDeduplication:
         findings = [
             _finding(
                 "scanner1",
-                file_path="policy.json",
+                file_path=_P_POLICY,
                 line_number=5,
                 rule_id="policy-violation",
                 severity=FindingSeverity.MEDIUM,
             ),
             _finding(
                 "scanner2",
-                file_path="policy.json",
+                file_path=_P_POLICY,
                 line_number=5,
                 rule_id="policy-violation",
                 severity=FindingSeverity.MEDIUM,
@@ -2,6 +2,7 @@
 
 import re
 
+import pytest
 from typer.testing import CliRunner
 
 from envdrift.cli import app
@@ -50,12 +51,15 @@ def test_diff_requires_two_files() -> None:
     assert result.exit_code != 0
 
 
-def test_diff_file_not_found(tmp_path) -> None:
-    """Test diff with missing env file."""
-    env1 = tmp_path / ".env1"
-    env1.write_text("FOO=bar")
+@pytest.mark.parametrize("missing_first", [False, True], ids=["env2-missing", "env1-missing"])
+def test_diff_file_not_found(tmp_path, missing_first: bool) -> None:
+    """Test diff with either env file missing."""
+    present = tmp_path / ".env"
+    present.write_text("FOO=bar")
+    missing = tmp_path / "missing.env"
+    files = [missing, present] if missing_first else [present, missing]
 
-    result = runner.invoke(app, ["diff", str(env1), str(tmp_path / "nonexistent.env")])
+    result = runner.invoke(app, ["diff", *map(str, files)])
     assert result.exit_code == 1
     assert result.stdout == ""
     assert "not found" in result.stderr.lower()
@@ -142,17 +146,6 @@ def test_diff_json_format(tmp_path) -> None:
     assert "differences" in result.stdout
 
 
-def test_diff_env1_missing(tmp_path) -> None:
-    """Diff reports the first file when only env2 exists."""
-    env2 = tmp_path / ".env2"
-    env2.write_text("FOO=bar")
-
-    result = runner.invoke(app, ["diff", str(tmp_path / "missing.env"), str(env2)])
-    assert result.exit_code == 1
-    assert result.stdout == ""
-    assert "not found" in result.stderr.lower()
-
-
 def test_diff_normalize_default_collapses_bool_casing(tmp_path) -> None:
     """Default --normalize hides trivial bool-casing drift."""
     env1 = tmp_path / ".env1"
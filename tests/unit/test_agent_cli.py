@@ -2,31 +2,37 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import platform
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
 import envdrift.agent.registry as registry_module
+import envdrift.cli_commands.agent as agent_module
 from envdrift.cli import app
 
 runner = CliRunner()
 
 
-class TestAgentRegisterCommand:
-    """Tests for 'envdrift agent register' command."""
+@pytest.fixture(autouse=True)
+def _reset_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with no registry singleton; monkeypatch restores it afterwards.
+
+    Tests install their own ``ProjectRegistry`` by assigning
+    ``registry_module._registry`` directly; the teardown undoes that too.
+    """
+    monkeypatch.setattr(registry_module, "_registry", None)
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset the global registry singleton before each test."""
 
-        registry_module._registry = None
-        yield
-        registry_module._registry = None
+class TestAgentRegisterCommand:
+    """Tests for 'envdrift agent register' command."""
 
     def test_register_current_directory(self, tmp_path: Path, monkeypatch):
         """Test registering the current directory."""
@@ -98,12 +104,6 @@ class TestAgentRegisterCommand:
         render through a real no-color Console so the assertion is independent of
         FORCE_COLOR / NO_COLOR in the environment.
         """
-        import io
-
-        from rich.console import Console
-
-        import envdrift.cli_commands.agent as agent_module
-
         registry_path = tmp_path / ".envdrift" / "projects.json"
         registry_module._registry = registry_module.ProjectRegistry(registry_path)
 
@@ -194,14 +194,6 @@ idle_timeout = "invalid"
 class TestAgentUnregisterCommand:
     """Tests for 'envdrift agent unregister' command."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset the global registry singleton before each test."""
-
-        registry_module._registry = None
-        yield
-        registry_module._registry = None
-
     def test_unregister_registered_project(self, tmp_path: Path):
         """Test unregistering a registered project."""
 
@@ -238,14 +230,6 @@ class TestAgentUnregisterCommand:
 class TestAgentListCommand:
     """Tests for 'envdrift agent list' command."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset the global registry singleton before each test."""
-
-        registry_module._registry = None
-        yield
-        registry_module._registry = None
-
     def test_list_empty(self, tmp_path: Path):
         """Test listing when no projects are registered."""
 
@@ -288,14 +272,6 @@ class TestAgentListCommand:
 class TestAgentStatusCommand:
     """Tests for 'envdrift agent status' command."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset the global registry singleton before each test."""
-
-        registry_module._registry = None
-        yield
-        registry_module._registry = None
-
     def test_status_agent_not_installed(self, tmp_path: Path):
         """Test status when agent is not installed."""
 
@@ -327,8 +303,6 @@ class TestAgentStatusCommand:
 
     def test_status_missing_running_line(self, tmp_path: Path):
         """Test status handles missing Running line as error."""
-        import subprocess
-
         registry_path = tmp_path / ".envdrift" / "projects.json"
         registry_module._registry = registry_module.ProjectRegistry(registry_path)
 
@@ -354,8 +328,6 @@ class TestAgentStatusCommand:
 
     def test_status_running_parses_running_line(self, tmp_path: Path):
         """Test status parses running state from the Running line."""
-        import subprocess
-
         registry_path = tmp_path / ".envdrift" / "projects.json"
         registry_module._registry = registry_module.ProjectRegistry(registry_path)
 
@@ -387,8 +359,6 @@ class TestAgentStatusCommand:
 
     def test_status_stopped_parses_running_false(self, tmp_path: Path):
         """Test status treats 'Running: false' as stopped."""
-        import subprocess
-
         registry_path = tmp_path / ".envdrift" / "projects.json"
         registry_module._registry = registry_module.ProjectRegistry(registry_path)
 
@@ -471,14 +441,6 @@ class TestAgentHelpCommand:
 class TestAgentRegistryCorruptionCli:
     """Regression tests for #492: corrupt registries surfaced cleanly via the CLI."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset the global registry singleton before each test."""
-
-        registry_module._registry = None
-        yield
-        registry_module._registry = None
-
     @staticmethod
     def _normalize(output: str) -> str:
         """Collapse Rich line-wrapping so substring asserts are width-stable."""
@@ -32,6 +32,7 @@ from tests.helpers import DummyEncryptionBackend
 runner = CliRunner()
 
 _ANSI_ESCAPES = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+_VERSION_NUMBER = re.compile(r"\d+\.\d+")
 
 
 def _plain_cli_output(output: str) -> str:
@@ -39,6 +40,15 @@ def _plain_cli_output(output: str) -> str:
     return " ".join(_ANSI_ESCAPES.sub("", output).split())
 
 
+def _raising(exc: BaseException):
+    """Return a stub that raises ``exc`` whatever it is called with."""
+
+    def _raise(*_args, **_kwargs):
+        raise exc
+
+    return _raise
+
+
 def _mock_sync_engine_success(monkeypatch):
     """Patch SyncEngine to return a successful result and silence output."""
 
@@ -438,71 +448,55 @@ class Settings(BaseSettings):
 class TestDiffCommand:
     """Tests for the diff CLI command."""
 
-    def test_diff_missing_first_file(self, tmp_path: Path):
-        """Test diff command with missing first file."""
-        env2 = tmp_path / "env2"
-        env2.write_text("FOO=bar")
-
-        result = runner.invoke(app, ["diff", str(tmp_path / "missing.env"), str(env2)])
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    def test_diff_missing_second_file(self, tmp_path: Path):
-        """Test diff command with missing second file."""
-        env1 = tmp_path / "env1"
-        env1.write_text("FOO=bar")
-
-        result = runner.invoke(app, ["diff", str(env1), str(tmp_path / "missing.env")])
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    def test_diff_identical_files(self, tmp_path: Path):
-        """Test diff command with identical files."""
-        env1 = tmp_path / "env1"
-        env2 = tmp_path / "env2"
-        env1.write_text("FOO=bar\nBAZ=qux")
-        env2.write_text("FOO=bar\nBAZ=qux")
-
-        result = runner.invoke(app, ["diff", str(env1), str(env2)])
-        assert result.exit_code == 0
-        assert "no drift" in result.output.lower() or "match" in result.output.lower()
-
-    def test_diff_basic(self, tmp_path: Path):
-        """diff exits successfully on simple files."""
-
-        env1 = tmp_path / ".env.dev"
-        env2 = tmp_path / ".env.prod"
-        env1.write_text("FOO=one\nBAR=two\n")
-        env2.write_text("FOO=one\nBAR=three\nNEW=val\n")
-
-        result = runner.invoke(app, ["diff", str(env1), str(env2)])
-
-        assert result.exit_code == 0
-        assert "Comparing" in result.output
-
-    def test_diff_with_changes(self, tmp_path: Path):
-        """Test diff command shows differences."""
-        env1 = tmp_path / "env1"
-        env2 = tmp_path / "env2"
-        env1.write_text("FOO=old\nREMOVED=val")
-        env2.write_text("FOO=new\nADDED=val")
-
-        result = runner.invoke(app, ["diff", str(env1), str(env2)])
-        assert result.exit_code == 0
-        # Should show the changes
-        assert "FOO" in result.output or "changed" in result.output.lower()
+    @pytest.mark.parametrize(
+        ("env1_text", "env2_text", "extra_args", "expected_exit", "expected_output"),
+        [
+            (None, "FOO=bar", [], 1, r"(?i)not found"),
+            ("FOO=bar", None, [], 1, r"(?i)not found"),
+            ("FOO=bar\nBAZ=qux", "FOO=bar\nBAZ=qux", [], 0, r"(?i)no drift|match"),
+            ("FOO=one\nBAR=two\n", "FOO=one\nBAR=three\nNEW=val\n", [], 0, r"Comparing"),
+            ("FOO=old\nREMOVED=val", "FOO=new\nADDED=val", [], 0, r"FOO|(?i:changed)"),
+            ("FOO=bar", "FOO=baz", ["--format", "json"], 0, r"\{"),
+            (
+                "SAME=value\nDIFF=old",
+                "SAME=value\nDIFF=new",
+                ["--include-unchanged"],
+                0,
+                r"SAME",
+            ),
+        ],
+        ids=[
+            "missing-first-file",
+            "missing-second-file",
+            "identical-files",
+            "basic",
+            "with-changes",
+            "json-format",
+            "include-unchanged",
+        ],
+    )
+    def test_diff_outcome(
+        self,
+        tmp_path: Path,
+        env1_text: str | None,
+        env2_text: str | None,
+        extra_args: list[str],
+        expected_exit: int,
+        expected_output: str,
+    ):
+        """Test diff exit code and output for missing, identical and differing files.
 
-    def test_diff_json_format(self, tmp_path: Path):
-        """Test diff --format json outputs JSON."""
+        A ``None`` text leaves that file missing.
+        """
         env1 = tmp_path / "env1"
         env2 = tmp_path / "env2"
-        env1.write_text("FOO=bar")
-        env2.write_text("FOO=baz")
+        for env_file, text in ((env1, env1_text), (env2, env2_text)):
+            if text is not None:
+                env_file.write_text(text)
 
-        result = runner.invoke(app, ["diff", str(env1), str(env2), "--format", "json"])
-        assert result.exit_code == 0
-        # JSON output should be parseable
-        assert "{" in result.output
+        result = runner.invoke(app, ["diff", str(env1), str(env2), *extra_args])
+        assert result.exit_code == expected_exit
+        assert re.search(expected_output, result.output)
 
     def test_diff_json_with_unparsable_lines_stays_ansi_clean(self, tmp_path: Path):
         """Parser diagnostics are data, not stray Rich output in JSON mode."""
@@ -522,17 +516,6 @@ class TestDiffCommand:
         json.loads(result.stdout)
         assert _ANSI_ESCAPES.search(result.stdout) is None
 
-    def test_diff_include_unchanged(self, tmp_path: Path):
-        """Test diff --include-unchanged shows all vars."""
-        env1 = tmp_path / "env1"
-        env2 = tmp_path / "env2"
-        env1.write_text("SAME=value\nDIFF=old")
-        env2.write_text("SAME=value\nDIFF=new")
-
-        result = runner.invoke(app, ["diff", str(env1), str(env2), "--include-unchanged"])
-        assert result.exit_code == 0
-        assert "SAME" in result.output
-
     def test_diff_format_unknown_exits_1(self, tmp_path: Path):
         """diff --format <unknown> exits 1 instead of silently rendering a table (#413)."""
         env1 = tmp_path / "env1"
@@ -675,7 +658,7 @@ class TestEncryptCommand:
         )
         monkeypatch.setattr(
             "envdrift.cli_commands.encryption.get_encryption_backend",
-            lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should not run")),
+            _raising(AssertionError("should not run")),
         )
 
         result = runner.invoke(app, ["encrypt", str(env_file)])
@@ -960,7 +943,7 @@ class TestDecryptCommand:
         )
         monkeypatch.setattr(
             "envdrift.cli_commands.encryption.get_encryption_backend",
-            lambda *a, **k: (_ for _ in ()).throw(AssertionError("should not run")),
+            _raising(AssertionError("should not run")),
         )
 
         result = runner.invoke(app, ["decrypt", str(env_file)])
@@ -997,7 +980,7 @@ class TestDecryptCommand:
         # If decrypt were called, raise to fail the test
         monkeypatch.setattr(
             "envdrift.integrations.dotenvx.DotenvxWrapper.decrypt",
-            lambda *a, **k: (_ for _ in ()).throw(RuntimeError("should not decrypt")),
+            _raising(RuntimeError("should not decrypt")),
         )
 
         result = runner.invoke(
@@ -1947,52 +1930,50 @@ class TestVersionCommand:
         assert result.exit_code == 0
         assert "envdrift" in result.output
         # Should contain version number pattern
-        import re
+        assert _VERSION_NUMBER.search(result.output)
 
-        assert re.search(r"\d+\.\d+", result.output)
 
+class _ProductionKeyVault:
+    """Vault client stub that always serves the production dotenvx key."""
 
-class TestVaultVerification:
-    """Tests for vault verification helper."""
-
-    def test_verify_vault_uses_isolated_keys(self, monkeypatch, tmp_path: Path):
-        """Ensure vault verification only exposes the vault key to dotenvx."""
+    def ensure_authenticated(self) -> None:
+        """Pretend authentication always succeeds."""
+        return None
 
-        env_file = tmp_path / ".env.production"
-        env_file.write_text("SECRET=encrypted")
+    def get_secret(self, name: str):
+        """Return a ``KEY=value`` secret for ``DOTENV_PRIVATE_KEY_PRODUCTION``."""
+        return SimpleNamespace(value="DOTENV_PRIVATE_KEY_PRODUCTION=vault-key")
 
-        secret_value = SimpleNamespace(value="DOTENV_PRIVATE_KEY_PRODUCTION=vault-key")
 
-        class DummyVault:
-            def ensure_authenticated(self) -> None:
-                """
-                Ensure the command runner is authenticated before performing operations.
+class TestVaultVerification:
+    """Tests for vault verification helper."""
 
-                Implementations should verify or establish the required authentication state for subsequent CLI actions.
-                """
-                return None
+    @pytest.fixture
+    def production_key_vault(self, monkeypatch) -> None:
+        """Serve the production key from a stub vault and report dotenvx as installed.
 
-            def get_secret(self, name: str):
-                """
-                Retrieve a secret value by its name.
+        Tests stub ``DotenvxWrapper.decrypt`` themselves, since that is the part
+        each one varies.
+        """
+        monkeypatch.setattr(
+            "envdrift.vault.get_vault_client", lambda *_, **__: _ProductionKeyVault()
+        )
+        monkeypatch.setattr(
+            "envdrift.integrations.dotenvx.DotenvxWrapper.is_installed",
+            lambda self: True,
+        )
 
-                Parameters:
-                    name (str): The key/name of the secret to retrieve.
+    def test_verify_vault_uses_isolated_keys(
+        self, monkeypatch, tmp_path: Path, production_key_vault: None
+    ):
+        """Ensure vault verification only exposes the vault key to dotenvx."""
 
-                Returns:
-                    secret_value: The secret associated with the provided name.
-                """
-                return secret_value
+        env_file = tmp_path / ".env.production"
+        env_file.write_text("SECRET=encrypted")
 
         # Set an unrelated key that should be stripped from the subprocess environment
         monkeypatch.setenv("DOTENV_PRIVATE_KEY_STAGING", "should-be-ignored")
 
-        monkeypatch.setattr("envdrift.vault.get_vault_client", lambda *_, **__: DummyVault())
-        monkeypatch.setattr(
-            "envdrift.integrations.dotenvx.DotenvxWrapper.is_installed",
-            lambda self: True,
-        )
-
         captured: dict = {}
 
         def fake_decrypt(self, env_path, env_keys_file=None, env=None, cwd=None):
@@ -2097,6 +2078,7 @@ class TestVaultVerification:
         project_id: str | None,
         config_filename: str | None,
         expected_extra_options: str,
+        production_key_vault: None,
     ):
         """Vault verification failure should guide restoring encrypted file and keys."""
 
@@ -2104,37 +2086,9 @@ class TestVaultVerification:
         env_file.write_text("SECRET=encrypted")
         config_path = tmp_path / config_filename if config_filename else None
 
-        secret_value = SimpleNamespace(value="DOTENV_PRIVATE_KEY_PRODUCTION=vault-key")
-
-        class DummyVault:
-            def ensure_authenticated(self) -> None:
-                """
-                Ensure the command runner is authenticated before performing operations.
-
-                Implementations should verify or establish the required authentication state for subsequent CLI actions.
-                """
-                return None
-
-            def get_secret(self, name: str):
-                """
-                Retrieve a secret value by its name.
-
-                Parameters:
-                    name (str): The key/name of the secret to retrieve.
-
-                Returns:
-                    secret_value: The secret associated with the provided name.
-                """
-                return secret_value
-
-        monkeypatch.setattr("envdrift.vault.get_vault_client", lambda *_, **__: DummyVault())
-        monkeypatch.setattr(
-            "envdrift.integrations.dotenvx.DotenvxWrapper.is_installed",
-            lambda self: True,
-        )
         monkeypatch.setattr(
             "envdrift.integrations.dotenvx.DotenvxWrapper.decrypt",
-            lambda *_, **__: (_ for _ in ()).throw(DotenvxError("bad key")),
+            _raising(DotenvxError("bad key")),
         )
 
         printed: list[str] = []
@@ -2163,31 +2117,21 @@ class TestVaultVerification:
         assert expected_sync_cmd in joined
         assert "-c pair.txt" not in joined
 
-    def test_verify_vault_gcp_passes_project_id(self, monkeypatch, tmp_path: Path):
+    def test_verify_vault_gcp_passes_project_id(
+        self, monkeypatch, tmp_path: Path, production_key_vault: None
+    ):
         """GCP provider should pass project_id through to the vault client."""
         env_file = tmp_path / ".env.production"
         env_file.write_text("SECRET=encrypted")
 
-        secret_value = SimpleNamespace(value="DOTENV_PRIVATE_KEY_PRODUCTION=vault-key")
         captured: dict[str, Any] = {}
 
-        class DummyVault:
-            def ensure_authenticated(self) -> None:
-                return None
-
-            def get_secret(self, name: str):
-                return secret_value
-
         def fake_get_vault_client(provider, **kwargs):
             captured["provider"] = provider
             captured["kwargs"] = kwargs
-            return DummyVault()
+            return _ProductionKeyVault()
 
         monkeypatch.setattr("envdrift.vault.get_vault_client", fake_get_vault_client)
-        monkeypatch.setattr(
-            "envdrift.integrations.dotenvx.DotenvxWrapper.is_installed",
-            lambda self: True,
-        )
         monkeypatch.setattr(
             "envdrift.integrations.dotenvx.DotenvxWrapper.decrypt",
             lambda *_, **__: None,
@@ -5703,7 +5647,7 @@ class TestVaultPushCommand:
 
         def failing_client(*_, **__):
             client = SimpleNamespace()
-            client.authenticate = lambda: (_ for _ in ()).throw(VaultError("Auth failed"))
+            client.authenticate = _raising(VaultError("Auth failed"))
             return client
 
         monkeypatch.setattr("envdrift.vault.get_vault_client", failing_client)
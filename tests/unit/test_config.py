@@ -373,13 +373,21 @@ class TestLoadConfig:
         with pytest.raises(ValueError, match="must be a table"):
             load_config(cfg)
 
-    def test_load_config_default_when_not_found(self, tmp_path: Path, monkeypatch):
+    def test_load_config_default_when_not_found(self, tmp_path: Path):
         """Test load_config returns default config when no file found."""
-        monkeypatch.chdir(tmp_path)
-        config = load_config()
+        config = load_config(start_dir=tmp_path)
         assert isinstance(config, EnvdriftConfig)
         assert config.schema is None
 
+    def test_load_config_start_dir_searches_parents(self, tmp_path: Path):
+        """Test auto-detection from start_dir walks up to a parent config."""
+        (tmp_path / "envdrift.toml").write_text('[envdrift]\nschema = "app:Settings"\n')
+        nested = tmp_path / "services" / "api"
+        nested.mkdir(parents=True)
+
+        config = load_config(start_dir=nested)
+        assert config.schema == "app:Settings"
+
     def test_load_config_envdrift_toml(self, tmp_path: Path):
         """Test load_config from envdrift.toml."""
         config_file = tmp_path / "envdrift.toml"
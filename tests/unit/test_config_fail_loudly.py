@@ -74,15 +74,12 @@ class TestFindConfigSkipsNonFiles:
         (tmp_path / "pyproject.toml").write_text("bad = [\n", encoding="utf-8")
         assert find_config(tmp_path) is None
 
-    def test_load_config_autodiscovery_with_directory_config_returns_default(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ):
+    def test_load_config_autodiscovery_with_directory_config_returns_default(self, tmp_path: Path):
         """load_config() auto-discovery never open()s a directory (#491)."""
         from envdrift.config import EnvdriftConfig, load_config
 
         (tmp_path / "envdrift.toml").mkdir()
-        monkeypatch.chdir(tmp_path)
-        config = load_config()
+        config = load_config(start_dir=tmp_path)
         assert isinstance(config, EnvdriftConfig)
 
 
@@ -14,6 +14,8 @@ These tests pin the lane contract the suite is built on:
    the same process never gets a vault client that cannot fail.
 4. No test is unconditionally ``pytest.mark.skip``-ed without a tracking
    issue reference (dead tests must be visible).
+5. No test module is a byte-for-byte copy of another, so a merge or rebase
+   artifact cannot silently run the same tests twice.
 
 Each check drives the real pytest (as a subprocess) or scans the real test
 tree -- nothing about the behavior under test is mocked.
@@ -22,6 +24,7 @@ tree -- nothing about the behavior under test is mocked.
 from __future__ import annotations
 
 import ast
+import hashlib
 import os
 import re
 import subprocess
@@ -368,3 +371,24 @@ def test_bare_skip_scan_matches_code_not_comments_or_docstrings(tmp_path: Path)
 
     # Only the bare decorator (line 7) and the issue-less reason (line 10).
     assert _bare_skip_offenders(sample) == [7, 10]
+
+
+def test_no_duplicate_test_modules() -> None:
+    """No two test modules may have identical content.
+
+    A module pasted into a second location (a merge/rebase artifact) is
+    collected twice under different node ids, doubling the wall-clock cost of
+    every test in it for zero extra coverage.
+    """
+    seen: dict[str, Path] = {}
+    duplicates: list[str] = []
+    for path in sorted(TESTS_DIR.rglob("test_*.py")):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if digest in seen:
+            duplicates.append(
+                f"{path.relative_to(REPO_ROOT)} == {seen[digest].relative_to(REPO_ROOT)}"
+            )
+        else:
+            seen[digest] = path
+
+    assert duplicates == [], f"Duplicate test modules (delete one copy): {duplicates}"